@@ -1,12 +1,31 @@
 from __future__ import annotations
+import itertools
+import os
 import random
-from dataclasses import dataclass
-from typing import Callable, List, Tuple
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple
 
 import customtkinter as ctk
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
-@dataclass
+def fmt_views(v: int) -> str:
+    return f"{v/1_000_000:.1f}M views" if v >= 1_000_000 else (f"{v/1_000:.1f}K views" if v >= 1_000 else f"{v} views")
+
+def fmt_age(days: int) -> str:
+    if days == 0:
+        return "today"
+    if days == 1:
+        return "1 day ago"
+    if days < 30:
+        return f"{days} days ago"
+    m = days // 30
+    return f"{m} months ago" if m < 12 else f"{m // 12} years ago"
+
+@dataclass(frozen=True, slots=True)
 class Video:
     id: str
     title: str
@@ -15,6 +34,11 @@ class Video:
     age_days: int
     duration: str
     color: Tuple[int, int, int]
+    views_str: str = field(init=False, repr=False, compare=False)
+    age_str: str = field(init=False, repr=False, compare=False)
+    def __post_init__(self):
+        object.__setattr__(self, "views_str", fmt_views(self.views))
+        object.__setattr__(self, "age_str", fmt_age(self.age_days))
 
 _random = random.Random(42)
 _palette = [
@@ -54,31 +78,79 @@ MOCK_VIDEOS: List[Video] = [
 ]
 
 ASSET_CACHE: dict = {}
+_SHADOW_CACHE: dict = {}
+_MASK_CACHE: dict = {}
+_TEXT_CACHE: dict = {}
+_SHAPE_LOCK = threading.RLock()  # pool workers share one mask/shadow render per shape
+_THUMB_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+_THUMB_FONT = _load_font(28)
+
+def _rounded_mask(size: Tuple[int, int], radius: int) -> Image.Image:
+    key = (size, radius)
+    if key not in _MASK_CACHE:
+        with _SHAPE_LOCK:
+            if key not in _MASK_CACHE:
+                mask = Image.new("L", size, 0)
+                ImageDraw.Draw(mask).rounded_rectangle((0, 0, size[0], size[1]), radius=radius, fill=255)
+                _MASK_CACHE[key] = mask
+    return _MASK_CACHE[key]
 
 def _rounded_shadow_rgba(size: Tuple[int, int], radius: int = 24, shadow: int = 12) -> Image.Image:
-    w, h = size
-    canvas = Image.new("RGBA", (w + shadow * 2, h + shadow * 2), (0, 0, 0, 0))
-    mask = Image.new("L", (w, h), 0)
-    ImageDraw.Draw(mask).rounded_rectangle((0, 0, w, h), radius=radius, fill=255)
-    shadow_img = Image.new("RGBA", (w, h), (0, 0, 0, 140))
-    canvas.paste(shadow_img, (shadow, shadow), mask)
-    canvas = canvas.filter(ImageFilter.GaussianBlur(10))
-    return canvas
+    key = (size, radius, shadow)
+    if key in _SHADOW_CACHE:
+        return _SHADOW_CACHE[key]
+    with _SHAPE_LOCK:
+        if key in _SHADOW_CACHE:
+            return _SHADOW_CACHE[key]
+        w, h = size
+        alpha = Image.new("L", (w + shadow * 2, h + shadow * 2), 0)
+        alpha.paste(140, (shadow, shadow), _rounded_mask(size, radius))
+        small = alpha.resize((alpha.width // 4, alpha.height // 4), Image.BILINEAR).filter(ImageFilter.BoxBlur(2))
+        canvas = Image.new("RGBA", alpha.size, (0, 0, 0, 0))
+        canvas.putalpha(small.resize(alpha.size, Image.BILINEAR))
+        _SHADOW_CACHE[key] = canvas
+        return canvas
 
 def _apply_rounded(img: Image.Image, radius: int = 24) -> Image.Image:
-    mask = Image.new("L", img.size, 0)
-    ImageDraw.Draw(mask).rounded_rectangle((0, 0, img.size[0], img.size[1]), radius=radius, fill=255)
-    img = img.convert("RGBA")
-    img.putalpha(mask)
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    w, h = img.size
+    mask = _rounded_mask(img.size, radius)
+    for box in ((0, 0, radius, radius), (w - radius, 0, w, radius), (0, h - radius, radius, h), (w - radius, h - radius, w, h)):
+        corner = img.crop(box)
+        corner.putalpha(mask.crop(box))
+        img.paste(corner, box)
     return img
 
+def _text_layer(text: str, size: Tuple[int, int]) -> Tuple[Image.Image, Tuple[int, int]]:
+    key = (text, size)
+    if key in _TEXT_CACHE:
+        return _TEXT_CACHE[key]
+    wrapped = "\n".join(textwrap.wrap(text, width=42)[:2])
+    x0, y0, x1, y1 = ImageDraw.Draw(Image.new("L", (1, 1))).multiline_textbbox((0, 0), wrapped, font=_THUMB_FONT)
+    w, h = x1 - x0, y1 - y0
+    mask = Image.new("L", (w, h))
+    ImageDraw.Draw(mask).multiline_text((-x0, -y0), wrapped, font=_THUMB_FONT, fill=255)
+    layer = Image.new("RGBA", (w + 2, h + 2), (0, 0, 0, 0))
+    layer.paste((0, 0, 0, 255), (2, 2), mask)
+    layer.paste((255, 255, 255, 255), (0, 0), mask)
+    _TEXT_CACHE[key] = (layer, (16 + x0, size[1] - h - 16 + y0))
+    return _TEXT_CACHE[key]
+
 def make_thumb(text: str, color=(220, 20, 60), size=(480, 270)) -> Image.Image:
     key = (text, color, size)
     if key in ASSET_CACHE:
         return ASSET_CACHE[key]
-    base_w, base_h = size
-    W, H = base_w * 2, base_h * 2
-    img = Image.new("RGB", (W, H), color)
+    shadow = 8
+    W, H = size[0] - shadow * 2, size[1] - shadow * 2
+    img = Image.new("RGBA", (W, H), color)
     overlay = Image.new("RGBA", (W, H), (0, 0, 0, 0))
     od = ImageDraw.Draw(overlay)
     tri_w = int(W * 0.16)
@@ -86,80 +158,59 @@ def make_thumb(text: str, color=(220, 20, 60), size=(480, 270)) -> Image.Image:
     cx, cy = W // 2, H // 2
     points = [(cx - tri_w // 3, cy - tri_h // 2), (cx - tri_w // 3, cy + tri_h // 2), (cx + tri_w, cy)]
     od.polygon(points, fill=(255, 255, 255, 150))
-    img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-    draw = ImageDraw.Draw(img)
-    try:
-        font = ImageFont.truetype("DejaVuSans.ttf", 56)
-    except (OSError, IOError):
-        font = ImageFont.load_default()
-    def wrap(t: str, max_chars=42):
-        words, lines, buf = t.split(), [], []
-        for w in words:
-            if sum(len(x) for x in buf) + len(buf) - 1 + len(w) > max_chars:
-                lines.append(" ".join(buf)); buf = [w]
-            else:
-                buf.append(w)
-        if buf: lines.append(" ".join(buf))
-        return "\n".join(lines[:2])
-    wrapped = wrap(text)
-    bbox = draw.multiline_textbbox((0, 0), wrapped, font=font)
-    x0, y0, x1, y1 = bbox
-    w, h = x1 - x0, y1 - y0
-    x = 32
-    y = H - h - 32
-    draw.multiline_text((x + 4, y + 4), wrapped, font=font, fill=(0, 0, 0))
-    draw.multiline_text((x, y), wrapped, font=font, fill=(255, 255, 255))
-    img = _apply_rounded(img, radius=36)
-    shadow = _rounded_shadow_rgba((W, H), radius=36, shadow=16)
-    canvas = Image.new("RGBA", shadow.size, (0, 0, 0, 0))
-    canvas.alpha_composite(shadow, (0, 0))
-    canvas.alpha_composite(img, (16, 16))
-    canvas = canvas.resize((base_w, base_h), Image.LANCZOS)
+    img.alpha_composite(overlay)
+    layer, pos = _text_layer(text, (W, H))
+    img.alpha_composite(layer, pos)
+    img = _apply_rounded(img, radius=18)
+    canvas = _rounded_shadow_rgba((W, H), radius=18, shadow=shadow).copy()
+    canvas.alpha_composite(img, (shadow, shadow))
     ASSET_CACHE[key] = canvas
     return canvas
 
-def fmt_views(v: int) -> str:
-    return f"{v/1_000_000:.1f}M views" if v >= 1_000_000 else (f"{v/1_000:.1f}K views" if v >= 1_000 else f"{v} views")
+_CYCLE_LEVELS = (1.0, 1.05, 0.93)
+_TINT_LUTS = {k: [min(255, round(i * k)) for i in range(256)] * 3 + list(range(256)) for k in _CYCLE_LEVELS}
 
-def fmt_age(days: int) -> str:
-    if days == 0:
-        return "today"
-    if days == 1:
-        return "1 day ago"
-    if days < 30:
-        return f"{days} days ago"
-    m = days // 30
-    return f"{m} months ago" if m < 12 else f"{m // 12} years ago"
+@lru_cache(maxsize=256)
+def _cycle_frame(text: str, k: float, color=(220, 20, 60), size=(480, 270)) -> Image.Image:
+    img = make_thumb(text, color, size)
+    return img if k == 1.0 else img.point(_TINT_LUTS[k])
+
+_FONT_HEADING = ("Segoe UI", 18, "bold")
+_FONT_CARD_TITLE = ("Segoe UI", 14, "bold")
+_FONT_CARD_META = ("Segoe UI", 12)
 
 class RippleButton(ctk.CTkButton):
+    _PULSE = (1.0, 0.97, 0.94, 0.91, 0.88, 0.91, 0.94, 0.97, 1.0)
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self._base_width = self.cget("width") or 0
         self._base_height = self.cget("height") or 0
+        self._pulse_sizes = tuple((int(self._base_width * k), int(self._base_height * k)) for k in self._PULSE)
+        self._pulse_job = None
         self.bind("<Button-1>", self._pulse, add="+")
     def _pulse(self, _evt=None):
-        w0, h0 = self._base_width, self._base_height
-        if w0 == 0 or h0 == 0:
+        if self._base_width == 0 or self._base_height == 0:
             return
-        def step(i):
-            if i <= 4:
-                k = 1 - i * 0.03
-                self.configure(width=int(w0 * k), height=int(h0 * k))
-                self.after(12, lambda: step(i + 1))
-            elif i <= 8:
-                k = 1 - (8 - i) * 0.03
-                self.configure(width=int(w0 * k), height=int(h0 * k))
-                self.after(12, lambda: step(i + 1))
-            else:
-                self.configure(width=w0, height=h0)
-        step(0)
+        if self._pulse_job:
+            self.after_cancel(self._pulse_job)
+        sizes = iter(self._pulse_sizes)
+        def step():
+            size = next(sizes, None)
+            if size is None:
+                self._pulse_job = None
+                return
+            self.configure(width=size[0], height=size[1])
+            self._pulse_job = self.after(12, step)
+        step()
 
 class CategoryChip(ctk.CTkButton):
+    _font0: ctk.CTkFont | None = None
+    _font1: ctk.CTkFont | None = None
     def __init__(self, master, text="", **kwargs):
-        super().__init__(master, text=text, height=28, corner_radius=14, **kwargs)
-        self._font0 = ctk.CTkFont(size=12)
-        self._font1 = ctk.CTkFont(size=13)
-        self.configure(font=self._font0)
+        if CategoryChip._font0 is None:
+            CategoryChip._font0 = ctk.CTkFont(size=12)
+            CategoryChip._font1 = ctk.CTkFont(size=13)
+        super().__init__(master, text=text, height=28, corner_radius=14, font=self._font0, **kwargs)
         self.bind("<Enter>", self._enter)
         self.bind("<Leave>", self._leave)
     def _enter(self, _):
@@ -174,6 +225,7 @@ class SlidingSidebar(ctk.CTkFrame):
         self._target_width = width
         self._cur = width
         self._visible = True
+        self._anim_job = None
         self.grid(row=1, column=0, sticky="nsw")
         self._apply_width(width)
     def _apply_width(self, w):
@@ -186,45 +238,60 @@ class SlidingSidebar(ctk.CTkFrame):
         steps = 16
         w0 = self._cur
         dw = (w_target - w0) / steps
-        i = 0
+        widths = iter(tuple(int(w0 + dw * i) for i in range(1, steps)) + (w_target,))
+        if self._anim_job:
+            self.after_cancel(self._anim_job)
         def anim():
-            nonlocal i
-            if i < steps:
-                cur = int(w0 + dw * i)
-                self._apply_width(cur)
-                i += 1
-                self.after(duration_ms // steps, anim)
-            else:
-                self._cur = w_target
-                self._apply_width(w_target)
+            w = next(widths, None)
+            if w is None:
+                self._anim_job = None
+                return
+            self._cur = w
+            self._apply_width(w)
+            self._anim_job = self.after(duration_ms // steps, anim)
         anim()
 
 class HoverThumb(ctk.CTkButton):
-    def __init__(self, master, images: List[Image.Image], command=None, **kwargs):
+    def __init__(self, master, frame: Callable[[float], Image.Image], command=None, **kwargs):
         self.thumb_size = kwargs.pop("thumb_size", (320, 180))
         super().__init__(master, text="", fg_color="transparent", hover=False, border_width=0, command=command, **kwargs)
-        self._frames = [ctk.CTkImage(light_image=im, dark_image=im, size=self.thumb_size) for im in images]
-        self._hover_frames = [ctk.CTkImage(light_image=im, dark_image=im, size=(int(self.thumb_size[0]*1.04), int(self.thumb_size[1]*1.04))) for im in images]
+        self._frame = frame
+        base = frame(1.0)
+        self._current = (ctk.CTkImage(light_image=base, dark_image=base, size=self.thumb_size), None)
+        self._cycle: Iterator[Tuple[ctk.CTkImage, ctk.CTkImage]] | None = None
         self._hover = False
-        self._idx = 0
-        self.configure(image=self._frames[0])
+        self.configure(image=self._current[0])
         self.bind("<Enter>", self._enter, add="+")
         self.bind("<Leave>", self._leave, add="+")
+        self.bind("<Unmap>", self._leave, add="+")
         self._cycle_job = None
+    def _load_frames(self):
+        if self._cycle is not None:
+            return
+        hover_size = (int(self.thumb_size[0]*1.04), int(self.thumb_size[1]*1.04))
+        images = [self._frame(k) for k in _CYCLE_LEVELS]
+        frames = [self._current[0]] + [ctk.CTkImage(light_image=im, dark_image=im, size=self.thumb_size) for im in images[1:]]
+        hover_frames = [ctk.CTkImage(light_image=im, dark_image=im, size=hover_size) for im in images]
+        self._cycle = itertools.cycle(list(zip(frames, hover_frames)))
+        self._current = next(self._cycle)
     def _enter(self, _e=None):
         self._hover = True
-        self.configure(image=self._hover_frames[self._idx])
+        self._load_frames()
+        self.configure(image=self._current[1])
         self._start_cycle()
     def _leave(self, _e=None):
         self._hover = False
-        self.configure(image=self._frames[self._idx])
+        self.configure(image=self._current[0])
         if self._cycle_job:
             self.after_cancel(self._cycle_job)
             self._cycle_job = None
     def _start_cycle(self):
         def tick():
-            self._idx = (self._idx + 1) % len(self._frames)
-            self.configure(image=self._hover_frames[self._idx] if self._hover else self._frames[self._idx])
+            if not self.winfo_viewable():
+                self._leave()
+                return
+            self._current = next(self._cycle)
+            self.configure(image=self._current[1] if self._hover else self._current[0])
             self._cycle_job = self.after(300, tick)
         if not self._cycle_job:
             self._cycle_job = self.after(300, tick)
@@ -234,18 +301,21 @@ class AnimatedProgressBar(ctk.CTkProgressBar):
         super().__init__(master, **kwargs)
         self.set(0.0)
         self._job = None
+        self._step = 0
+        self._direction = 1
     def start(self):
         if self._job:
             return
-        def anim(val=0.0, direction=1):
-            v = val + direction * 0.01
-            if v >= 1.0:
-                v, direction = 1.0, -1
-            if v <= 0.0:
-                v, direction = 0.0, 1
-            self.set(v)
-            self._job = self.after(16, lambda: anim(v, direction))
-        anim()
+        self._step, self._direction = 0, 1
+        self._anim()
+    def _anim(self):
+        self._step += self._direction
+        if self._step >= 100:
+            self._step, self._direction = 100, -1
+        if self._step <= 0:
+            self._step, self._direction = 0, 1
+        self.set(self._step / 100)
+        self._job = self.after(16, self._anim)
     def stop(self):
         if self._job:
             self.after_cancel(self._job)
@@ -255,15 +325,17 @@ class HeaderBar(ctk.CTkFrame):
     def __init__(self, master, on_search: Callable[[str], None]):
         super().__init__(master, fg_color=("#181818", "#181818"))
         self.on_search = on_search
+        self._search_job = None
         self.menu_btn = RippleButton(self, text="≡", width=44, height=36, corner_radius=10, command=master.toggle_sidebar)
         self.menu_btn.grid(row=0, column=0, padx=(10, 6), pady=10)
-        self.logo = ctk.CTkLabel(self, text="SceneHop", font=("Segoe UI", 18, "bold"))
+        self.logo = ctk.CTkLabel(self, text="SceneHop", font=_FONT_HEADING)
         self.logo.grid(row=0, column=1, padx=(0, 12))
         self.search_var = ctk.StringVar()
         self.search = ctk.CTkEntry(self, textvariable=self.search_var, placeholder_text="Search", height=36, corner_radius=12, width=520)
         self.search.grid(row=0, column=2, sticky="ew")
-        self.search.bind("<Return>", lambda _e: self.on_search(self.search_var.get().strip()))
-        self.search_btn = RippleButton(self, text="🔎", width=44, height=36, corner_radius=10, command=lambda: self.on_search(self.search_var.get().strip()))
+        self.search.bind("<Return>", self._do_search)
+        self.search.bind("<KeyRelease>", self._debounce_search)
+        self.search_btn = RippleButton(self, text="🔎", width=44, height=36, corner_radius=10, command=self._do_search)
         self.search_btn.grid(row=0, column=3, padx=(6, 6))
         self.mic_btn = RippleButton(self, text="🎤", width=44, height=36, corner_radius=10)
         self.mic_btn.grid(row=0, column=4)
@@ -274,6 +346,17 @@ class HeaderBar(ctk.CTkFrame):
         self.avatar = ctk.CTkLabel(self, text="A", width=36, height=36, corner_radius=18, fg_color="#3d3d3d")
         self.avatar.grid(row=0, column=7, padx=(6, 12))
         self.grid_columnconfigure(2, weight=1)
+    def _debounce_search(self, event):
+        if event.keysym == "Return":
+            return
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(120, self._do_search)
+    def _do_search(self, *_):
+        if self._search_job:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        self.on_search(self.search_var.get().strip())
 
 class SideNav(ctk.CTkFrame):
     def __init__(self, master, on_nav: Callable[[str], None]):
@@ -295,17 +378,13 @@ class VideoCard(ctk.CTkFrame):
         super().__init__(master, fg_color="transparent")
         self.video = video
         self.on_open = on_open
-        base = make_thumb(video.title, size=(480, 270))
-        alt1 = make_thumb(video.title, size=(480, 270))
-        alt2 = make_thumb(video.title, size=(480, 270))
-        images = [base, alt1, alt2]
-        self.thumb_btn = HoverThumb(self, images, thumb_size=(320, 180), command=self._clicked)
+        self.thumb_btn = HoverThumb(self, lambda k: _cycle_frame(video.title, k, size=(480, 270)), thumb_size=(320, 180), command=self._clicked)
         self.thumb_btn.grid(row=0, column=0, columnspan=2, sticky="nsew")
         self.badge = ctk.CTkLabel(self.thumb_btn, text=video.duration, fg_color="#000000", text_color="#ffffff")
         self.badge.place(relx=0.98, rely=0.02, anchor="ne")
-        self.title = ctk.CTkLabel(self, text=video.title, font=("Segoe UI", 14, "bold"), justify="left")
+        self.title = ctk.CTkLabel(self, text=video.title, font=_FONT_CARD_TITLE, justify="left")
         self.title.grid(row=1, column=0, columnspan=2, sticky="w", pady=(8, 0))
-        self.meta = ctk.CTkLabel(self, text=f"{video.channel} • {fmt_views(video.views)} • {fmt_age(video.age_days)}", font=("Segoe UI", 12))
+        self.meta = ctk.CTkLabel(self, text=f"{video.channel} • {video.views_str} • {video.age_str}", font=_FONT_CARD_META)
         self.meta.grid(row=2, column=0, columnspan=2, sticky="w")
     def _clicked(self):
         self.on_open(self.video)
@@ -314,19 +393,22 @@ class VideoGrid(ctk.CTkScrollableFrame):
     def __init__(self, master, on_open: Callable[[Video], None]):
         super().__init__(master, fg_color="transparent")
         self.on_open = on_open
-        self.cards: List[VideoCard] = []
+        self.cards: Dict[str, VideoCard] = {}
         for col in range(4):
             self.columnconfigure(col, weight=1, uniform="cols")
     def populate(self, videos: List[Video]):
-        for w in self.cards:
-            w.destroy()
-        self.cards.clear()
+        wanted = {v.id for v in videos}
+        for vid, card in self.cards.items():
+            if vid not in wanted:
+                card.grid_remove()
+        list(_THUMB_POOL.map(lambda t: make_thumb(t, size=(480, 270)), {v.title for v in videos if v.id not in self.cards}))
         for i, v in enumerate(videos):
-            card = VideoCard(self, v, on_open=self.on_open)
+            card = self.cards.get(v.id)
+            if card is None:
+                card = self.cards[v.id] = VideoCard(self, v, on_open=self.on_open)
             col = i % 4
             row = i // 4
             card.grid(row=row, column=col, padx=10, pady=12, sticky="nsew")
-            self.cards.append(card)
     def filter(self, query: str):
         q = query.lower()
         visible = [v for v in MOCK_VIDEOS if q in v.title.lower() or q in v.channel.lower()]
@@ -339,26 +421,47 @@ class PlayerOverlay(ctk.CTkToplevel):
         self.geometry("1024x640")
         self.configure(fg_color="#0f0f0f")
         self.bind("<Escape>", lambda _e: self.destroy())
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self._attach_job = None
         left = ctk.CTkFrame(self, fg_color="#181818")
         left.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        big_img = make_thumb(video.title, color=video.color, size=(1280, 720))
+        big_img = make_thumb(video.title, color=video.color, size=(480, 270))
         big = ctk.CTkImage(light_image=big_img, dark_image=big_img, size=(960, 540))
         ctk.CTkLabel(left, text="", image=big).pack(padx=10, pady=10)
-        ctk.CTkLabel(left, text=video.title, font=("Segoe UI", 18, "bold")).pack(anchor="w", padx=12)
-        ctk.CTkLabel(left, text=f"{video.channel} • {fmt_views(video.views)} • {fmt_age(video.age_days)}").pack(anchor="w", padx=12, pady=(0,10))
+        ctk.CTkLabel(left, text=video.title, font=_FONT_HEADING).pack(anchor="w", padx=12)
+        ctk.CTkLabel(left, text=f"{video.channel} • {video.views_str} • {video.age_str}").pack(anchor="w", padx=12, pady=(0,10))
         right = ctk.CTkScrollableFrame(self, width=340, fg_color="#0f0f0f")
         right.grid(row=0, column=1, sticky="nsew", padx=(0,10), pady=10)
         recs = MOCK_VIDEOS[:12]
+        pending = []
         for rv in recs:
-            thumb = ctk.CTkImage(light_image=make_thumb(rv.title, rv.color, (480,270)), dark_image=make_thumb(rv.title, rv.color, (480,270)), size=(160, 90))
             f = ctk.CTkFrame(right, fg_color="transparent")
             f.pack(fill="x", padx=8, pady=8)
-            ctk.CTkLabel(f, text="", image=thumb, width=160, height=90).grid(row=0, column=0, rowspan=2, sticky="w")
+            thumb = ctk.CTkLabel(f, text="", width=160, height=90, fg_color="#181818")
+            thumb.grid(row=0, column=0, rowspan=2, sticky="w")
+            pending.append((thumb, _THUMB_POOL.submit(make_thumb, rv.title, rv.color, (480, 270))))
             ctk.CTkLabel(f, text=rv.title, font=("Segoe UI", 12, "bold"), wraplength=160, justify="left").grid(row=0, column=1, sticky="w", padx=8)
-            ctk.CTkLabel(f, text=f"{rv.channel}\n{fmt_views(rv.views)} • {fmt_age(rv.age_days)}", justify="left").grid(row=1, column=1, sticky="nw", padx=8)
+            ctk.CTkLabel(f, text=f"{rv.channel}\n{rv.views_str} • {rv.age_str}", justify="left").grid(row=1, column=1, sticky="nw", padx=8)
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         ctk.CTkButton(self, text="✕ Close", command=self.destroy).grid(row=1, column=0, columnspan=2, pady=(0,10))
+        self._attach_thumbs(pending)
+    def _attach_thumbs(self, pending):
+        self._attach_job = None
+        waiting = []
+        for label, future in pending:
+            if future.done():
+                img = future.result()
+                label.configure(image=ctk.CTkImage(light_image=img, dark_image=img, size=(160, 90)))
+            else:
+                waiting.append((label, future))
+        if waiting:
+            self._attach_job = self.after(16, self._attach_thumbs, waiting)
+    def destroy(self):
+        if self._attach_job is not None:
+            self.after_cancel(self._attach_job)
+            self._attach_job = None
+        super().destroy()
 
 class HomeView(ctk.CTkFrame):
     def __init__(self, master, on_open: Callable[[Video], None]):
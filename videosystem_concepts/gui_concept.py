@@ -8,13 +8,22 @@ Notes
 - Click any video card to open a mock "watch" view.
 - Press Esc or the X in the player to close the watch view.
 - If you don’t have customtkinter:  pip install customtkinter pillow
+- Optional: pillow-simd is a drop-in replacement for pillow with faster thumbnail rendering.
+- Rendered thumbnails are cached in ~/.cache/scenehop/thumbs/; delete it to force a re-render.
 """
 
 import os
 import sys
+import json
+import heapq
+import atexit
+import hashlib
 import random
-from dataclasses import dataclass
-from typing import Callable, List
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Callable, Dict, List
 
 try:
     import customtkinter as ctk
@@ -26,7 +35,29 @@ from PIL import Image, ImageDraw, ImageFont
 # ----------------------
 # Mock data structures
 # ----------------------
-@dataclass
+def fmt_views(v: int) -> str:
+    if v >= 1_000_000:
+        return f"{v/1_000_000:.1f}M views"
+    if v >= 1_000:
+        return f"{v/1_000:.1f}K views"
+    return f"{v} views"
+
+
+def fmt_age(days: int) -> str:
+    if days == 0:
+        return "today"
+    if days == 1:
+        return "1 day ago"
+    if days < 30:
+        return f"{days} days ago"
+    months = days // 30
+    if months < 12:
+        return f"{months} months ago"
+    years = months // 12
+    return f"{years} years ago"
+
+
+@dataclass(frozen=True, slots=True)
 class Video:
     id: str
     title: str
@@ -35,6 +66,18 @@ class Video:
     age_days: int
     duration: str
     color: tuple  # RGB for placeholder thumbnail tint
+    # display/search strings, derived once in __post_init__
+    stats: str = field(init=False, repr=False, compare=False)
+    meta: str = field(init=False, repr=False, compare=False)
+    search_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen: assign through object.__setattr__
+        stats = f"{fmt_views(self.views)} • {fmt_age(self.age_days)}"
+        object.__setattr__(self, "stats", stats)
+        object.__setattr__(self, "meta", f"{self.channel} • {stats}")
+        # "\0" keeps a query from matching across the title/channel boundary
+        object.__setattr__(self, "search_key", f"{self.title}\0{self.channel}".lower())
 
 
 MOCK_VIDEOS: List[Video] = []
@@ -86,79 +129,143 @@ for i in range(24):
 # ----------------------
 ASSET_CACHE = {}
 
+# Rendered thumbnails are deterministic, so the app keeps them across runs: one PNG
+# per cache key plus an index.json mapping file name -> key. Bump THUMB_CACHE_VERSION
+# whenever make_thumb's output changes.
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scenehop", "thumbs")
+THUMB_CACHE_VERSION = 1
+_persisted_keys = set()
+
+
+def _thumb_file(key) -> str:
+    return hashlib.sha1(repr(key).encode()).hexdigest()[:16] + ".png"
+
+
+def _load_asset_cache():
+    """Fill ASSET_CACHE from THUMB_CACHE_DIR; a missing or stale cache is just skipped."""
+    try:
+        with open(os.path.join(THUMB_CACHE_DIR, "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != THUMB_CACHE_VERSION:
+            return
+        for name, (text, color, size) in index["thumbs"].items():
+            key = (text, tuple(color), tuple(size))
+            with Image.open(os.path.join(THUMB_CACHE_DIR, name)) as img:
+                ASSET_CACHE[key] = img.convert("RGB")
+            _persisted_keys.add(key)
+    except Exception:
+        pass  # corrupt or partial: whatever loaded is fine, the rest renders again
+
+
+def _save_asset_cache():
+    new_keys = ASSET_CACHE.keys() - _persisted_keys
+    if not new_keys:
+        return
+    try:
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+        for key in new_keys:
+            ASSET_CACHE[key].save(os.path.join(THUMB_CACHE_DIR, _thumb_file(key)), "PNG", compress_level=1)
+        index = {"version": THUMB_CACHE_VERSION,
+                 "thumbs": {_thumb_file(k): k for k in _persisted_keys | new_keys}}
+        tmp = os.path.join(THUMB_CACHE_DIR, "index.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp, os.path.join(THUMB_CACHE_DIR, "index.json"))
+    except OSError:
+        pass  # read-only home etc.; the cache is only an optimisation
+
+
+def _load_font(size: int):
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+# loaded once; opening the TTF per thumbnail is the slow part of a cache miss
+_THUMB_FONT = _load_font(28)
+
 def make_thumb(text: str, color=(220, 20, 60), size=(480, 270)):
     key = (text, color, size)
     if key in ASSET_CACHE:
         return ASSET_CACHE[key]
     img = Image.new("RGB", size, color)
     draw = ImageDraw.Draw(img)
-    # Semi-transparent play triangle
-    overlay = Image.new("RGBA", size, (0, 0, 0, 0))
-    od = ImageDraw.Draw(overlay)
+    # Play triangle: solid fill pre-blended as white at alpha 150 over the tint
     tri_w = int(size[0] * 0.16)
     tri_h = int(size[1] * 0.20)
     cx, cy = size[0] // 2, size[1] // 2
     points = [(cx - tri_w // 3, cy - tri_h // 2), (cx - tri_w // 3, cy + tri_h // 2), (cx + tri_w, cy)]
-    od.polygon(points, fill=(255, 255, 255, 150))
-    img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
+    blend = tuple((c * 105 + 255 * 150 + 127) // 255 for c in color)
+    draw.polygon(points, fill=blend)
 
     # Title text (fit with wrap)
-    try:
-        font = ImageFont.truetype("DejaVuSans.ttf", 28)
-    except Exception:
-        font = ImageFont.load_default()
-
-    def wrap(t: str, max_chars=24):
-        words = t.split()
-        lines = []
-        buf = []
-        for w in words:
-            if sum(len(x) for x in buf) + len(buf) - 1 + len(w) > max_chars:
-                lines.append(" ".join(buf))
-                buf = [w]
-            else:
-                buf.append(w)
-        if buf:
-            lines.append(" ".join(buf))
-        return "\n".join(lines[:2])
+    font = _THUMB_FONT
 
-    wrapped = wrap(text)
+    # estimate characters per line from the font's average glyph width
+    max_chars = max(1, int(size[0] * 0.9 / font.getlength("a")))
+    wrapped = "\n".join(textwrap.wrap(text, width=max_chars)[:2])
     bbox = draw.multiline_textbbox((0, 0), wrapped, font=font)
     x0, y0, x1, y1 = bbox
     w, h = x1 - x0, y1 - y0
 
     x = 16
-    y = size[1] - h - 16
+    y = size[1] - y1 - 16
 
-    # Text shadow
-    draw.multiline_text((x+2, y+2), wrapped, font=font, fill=(0,0,0))
-    draw.multiline_text((x, y), wrapped, font=font, fill=(255,255,255))
+    # Rasterize the glyphs once, then stamp the mask twice: shadow, then text
+    mask = Image.new("L", (w, h))
+    ImageDraw.Draw(mask).multiline_text((-x0, -y0), wrapped, font=font, fill=255)
+    img.paste((0, 0, 0), (x + x0 + 2, y + y0 + 2), mask)
+    img.paste((255, 255, 255), (x + x0, y + y0), mask)
 
     return_img = img
     ASSET_CACHE[key] = return_img
     return return_img
 
 
-def fmt_views(v: int) -> str:
-    if v >= 1_000_000:
-        return f"{v/1_000_000:.1f}M views"
-    if v >= 1_000:
-        return f"{v/1_000:.1f}K views"
-    return f"{v} views"
+CTKIMAGE_CACHE = {}
 
+def get_ctk_thumb(video: Video, size=(320, 180), thumb_size=(480, 270)) -> ctk.CTkImage:
+    """Return a shared CTkImage for a video at a display size, rendering it on first use."""
+    key = (video, size)
+    if key not in CTKIMAGE_CACHE:
+        img = make_thumb(video.title, video.color, thumb_size)
+        CTKIMAGE_CACHE[key] = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+    return CTKIMAGE_CACHE[key]
+
+
+def prefetch_thumbs(videos: List[Video], size=(480, 270)):
+    """Render thumbnails into ASSET_CACHE on a thread pool (Pillow releases the GIL while drawing)."""
+    keys = {(v.title, v.color) for v in videos}
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        list(pool.map(lambda k: make_thumb(k[0], k[1], size), keys))
 
-def fmt_age(days: int) -> str:
-    if days == 0:
-        return "today"
-    if days == 1:
-        return "1 day ago"
-    if days < 30:
-        return f"{days} days ago"
-    months = days // 30
-    if months < 12:
-        return f"{months} months ago"
-    years = months // 12
-    return f"{years} years ago"
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """Bigram index over Video.search_key so a query only scans likely matches."""
+
+    def __init__(self, videos: List[Video]):
+        self.videos = list(videos)
+        self.postings = {}  # bigram -> set of positions in self.videos
+        for i, v in enumerate(self.videos):
+            for gram in _bigrams(v.search_key):
+                self.postings.setdefault(gram, set()).add(i)
+
+    def match(self, query: str) -> List[Video]:
+        grams = _bigrams(query)
+        if not grams:  # 0-1 chars: nothing to narrow by
+            return [v for v in self.videos if query in v.search_key]
+        sets = sorted((self.postings.get(g, set()) for g in grams), key=len)
+        hits = set(sets[0]).intersection(*sets[1:])
+        # every bigram present doesn't mean they're contiguous, so verify
+        return [self.videos[i] for i in sorted(hits) if query in self.videos[i].search_key]
+
+
+SEARCH_INDEX = SearchIndex(MOCK_VIDEOS)
 
 # ----------------------
 # Core UI Components
@@ -176,13 +283,15 @@ class HeaderBar(ctk.CTkFrame):
         self.logo.grid(row=0, column=1, padx=(0, 12))
 
         # Center: search
-        self.search_var = ctk.StringVar()
-        self.search = ctk.CTkEntry(self, textvariable=self.search_var, placeholder_text="Search", height=36, corner_radius=12, width=520)
+        self.search = ctk.CTkEntry(self, placeholder_text="Search", height=36, corner_radius=12, width=520)
         self.search.grid(row=0, column=2, sticky="ew")
-        self.search.bind("<Return>", lambda e: self.on_search(self.search_var.get().strip()))
+        self.search.bind("<Return>", self._do_search)
+        # Live search: filter once typing pauses for 150 ms
+        self._search_job = None
+        self.search.bind("<KeyRelease>", self._debounce_search)
 
         self.search_btn = ctk.CTkButton(self, text="🔎", width=44, height=36, corner_radius=10,
-                                        command=lambda: self.on_search(self.search_var.get().strip()))
+                                        command=self._do_search)
         self.search_btn.grid(row=0, column=3, padx=(6, 6))
 
         self.mic_btn = ctk.CTkButton(self, text="🎤", width=44, height=36, corner_radius=10)
@@ -200,6 +309,20 @@ class HeaderBar(ctk.CTkFrame):
 
         self.grid_columnconfigure(2, weight=1)
 
+    def _debounce_search(self, event):
+        if event.keysym == "Return":
+            return  # already searched by the <Return> binding
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(150, self._do_search)
+
+    def _do_search(self, *_):
+        if self._search_job:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        # Read the entry directly rather than through a StringVar
+        self.on_search(self.search.get().strip())
+
     def _toggle_menu(self):
         self.master.toggle_sidebar()
 
@@ -251,11 +374,10 @@ class VideoCard(ctk.CTkFrame):
         self.on_click = on_click
 
         # Thumbnail
-        img = make_thumb(video.title, color=video.color)
-        self.thumb_img = ctk.CTkImage(light_image=img, dark_image=img, size=(320, 180))
+        self.thumb_img = get_ctk_thumb(video, (320, 180))
         self.thumb_btn = ctk.CTkButton(self, text="", image=self.thumb_img, width=320, height=180,
                                        corner_radius=12, command=self._clicked)
-        self.thumb_btn.grid(row=0, column=0, columnspan=2, sticky="nsew")
+        self.thumb_btn.pack(fill="x")
 
         # Duration badge (top-right)
         self.badge = ctk.CTkLabel(self, text=video.duration, fg_color="#000000", text_color="#ffffff")
@@ -263,39 +385,119 @@ class VideoCard(ctk.CTkFrame):
 
         # Title and meta
         self.title = ctk.CTkLabel(self, text=video.title, font=("Segoe UI", 14, "bold"), justify="left")
-        self.title.grid(row=1, column=0, columnspan=2, sticky="w", pady=(8, 0))
+        self.title.pack(anchor="w", pady=(8, 0))
+
+        self.meta = ctk.CTkLabel(self, text=video.meta, font=("Segoe UI", 12))
+        self.meta.pack(anchor="w")
 
-        self.meta = ctk.CTkLabel(self, text=f"{video.channel} • {fmt_views(video.views)} • {fmt_age(video.age_days)}",
-                                 font=("Segoe UI", 12))
-        self.meta.grid(row=2, column=0, columnspan=2, sticky="w")
+    def bind_video(self, video: Video):
+        """Point this card at another video without rebuilding its widgets."""
+        if video is self.video:
+            return
+        self.video = video
+        self.thumb_img = get_ctk_thumb(video, (320, 180))
+        self.thumb_btn.configure(image=self.thumb_img)
+        self.badge.configure(text=video.duration)
+        self.title.configure(text=video.title)
+        self.meta.configure(text=video.meta)
 
     def _clicked(self):
         self.on_click(self.video)
 
 
 class VideoGrid(ctk.CTkScrollableFrame):
+    COLS = 4
+    # A card row needs ~272 unscaled CTk units: thumb 180 + button border spacing 2*2
+    # + title pady 8 + title 28 + meta 28 + grid pady 2*12. Reserving a bit more means
+    # every row, realized or empty, is exactly this tall, so releasing one never
+    # shifts the rows below it.
+    ROW_HEIGHT = 280
+    MARGIN_ROWS = 1   # realized above/below the viewport so scrolling doesn't show gaps
+
     def __init__(self, master, on_open: Callable[[Video], None]):
         super().__init__(master, fg_color="transparent")
         self.on_open = on_open
-        self.cards: List[VideoCard] = []
+        self.videos: List[Video] = []
+        self.cards: Dict[int, VideoCard] = {}  # index into self.videos -> realized VideoCard
+        self.spare: List[VideoCard] = []  # pooled cards not currently shown
+        self.viewport_rows = range(0)
+        self.n_rows = 0
         self.columnconfigure((0, 1, 2, 3), weight=1, uniform="cols")
+        # Every scroll (wheel, scrollbar drag, resize) ends in yscrollcommand
+        self._parent_canvas.configure(yscrollcommand=self._on_yscroll)
 
     def populate(self, videos: List[Video]):
-        # Clear existing
-        for w in self.cards:
-            w.destroy()
-        self.cards.clear()
-        for i, v in enumerate(videos):
-            card = VideoCard(self, v, on_click=self.on_open)
-            col = i % 4
-            row = i // 4
-            card.grid(row=row, column=col, padx=10, pady=12, sticky="nsew")
-            self.cards.append(card)
+        self.videos = videos
+        # Reserve height for every row so the scrollbar reflects the whole list,
+        # even though only the rows near the viewport hold cards
+        n_rows = -(-len(videos) // self.COLS)
+        for row in range(n_rows, self.n_rows):
+            self.rowconfigure(row, minsize=0)
+        self.n_rows = n_rows
+        self._reserve_rows()
+        for i, card in list(self.cards.items()):
+            if i < len(videos):
+                card.bind_video(videos[i])
+            else:
+                self._release(i)
+        self.viewport_rows = range(0)
+        self._update_viewport()
+
+    def _row_px(self) -> int:
+        # minsize is in raw pixels, while CTk scales the cards and their padding
+        return self._apply_widget_scaling(self.ROW_HEIGHT)
+
+    def _reserve_rows(self):
+        for row in range(self.n_rows):
+            self.rowconfigure(row, minsize=self._row_px())
+
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        self._reserve_rows()
+        self.viewport_rows = range(0)
+        self._update_viewport()
+
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        self._update_viewport()
+
+    def _update_viewport(self):
+        # yview()[0] is the scroll offset as a fraction of the inner frame's height
+        row_px = self._row_px()
+        height = max(self.winfo_height(), self.n_rows * row_px)
+        y0 = int(self._parent_canvas.yview()[0] * height)
+        y1 = y0 + self._parent_canvas.winfo_height()
+        first = max(0, y0 // row_px - self.MARGIN_ROWS)
+        last = min(self.n_rows, y1 // row_px + 1 + self.MARGIN_ROWS)
+        rows = range(first, last)
+        if rows == self.viewport_rows:
+            return
+        self.viewport_rows = rows
+        lo, hi = first * self.COLS, min(last * self.COLS, len(self.videos))
+        for i in [i for i in self.cards if not lo <= i < hi]:
+            self._release(i)
+        for i in range(lo, hi):
+            if i not in self.cards:
+                self._realize(i)
+
+    def _realize(self, i: int):
+        video = self.videos[i]
+        if self.spare:
+            card = self.spare.pop()
+            card.bind_video(video)
+        else:
+            card = VideoCard(self, video, on_click=self.on_open)
+        card.grid(row=i // self.COLS, column=i % self.COLS, padx=10, pady=12, sticky="nsew")
+        self.cards[i] = card
+
+    def _release(self, i: int):
+        card = self.cards.pop(i)
+        card.grid_remove()
+        self.spare.append(card)
 
     def filter(self, query: str):
         q = query.lower()
-        visible = [v for v in MOCK_VIDEOS if q in v.title.lower() or q in v.channel.lower()]
-        self.populate(visible)
+        self.populate(SEARCH_INDEX.match(q))
 
 
 class PlayerOverlay(ctk.CTkToplevel):
@@ -306,18 +508,21 @@ class PlayerOverlay(ctk.CTkToplevel):
         self.geometry("1024x640")
         self.configure(fg_color="#0f0f0f")
         self.bind("<Escape>", lambda e: self.destroy())
+        # the window-manager close button must also go through destroy() below
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
 
         # Fake player left panel
         left = ctk.CTkFrame(self, fg_color="#181818")
         left.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
-        # large thumbnail as video area
-        img = make_thumb(video.title, color=video.color, size=(1280, 720))
-        big = ctk.CTkImage(light_image=img, dark_image=img, size=(960, 540))
-        ctk.CTkLabel(left, text="", image=big).pack(padx=10, pady=10)
+        # large thumbnail as video area (the grid's cached 480x270 render, scaled up)
+        big = get_ctk_thumb(video, (960, 540))
+        big_label = ctk.CTkLabel(left, text="", image=big)
+        big_label.pack(padx=10, pady=10)
+        self._image_labels = [big_label]
 
         ctk.CTkLabel(left, text=video.title, font=("Segoe UI", 18, "bold")).pack(anchor="w", padx=12)
-        ctk.CTkLabel(left, text=f"{video.channel} • {fmt_views(video.views)} • {fmt_age(video.age_days)}").pack(anchor="w", padx=12, pady=(0,10))
+        ctk.CTkLabel(left, text=video.meta).pack(anchor="w", padx=12, pady=(0,10))
 
         # Right sidebar: recommendations
         right = ctk.CTkScrollableFrame(self, width=340, fg_color="#0f0f0f")
@@ -325,13 +530,14 @@ class PlayerOverlay(ctk.CTkToplevel):
 
         recs = MOCK_VIDEOS[:12]
         for rv in recs:
-            thumb = ctk.CTkImage(light_image=make_thumb(rv.title, rv.color, (320,180)),
-                                  dark_image=make_thumb(rv.title, rv.color, (320,180)), size=(160, 90))
+            thumb = get_ctk_thumb(rv, (160, 90))  # reuses the grid's cached render
             f = ctk.CTkFrame(right, fg_color="transparent")
             f.pack(fill="x", padx=8, pady=8)
-            ctk.CTkLabel(f, text="", image=thumb, width=160, height=90).grid(row=0, column=0, rowspan=2, sticky="w")
+            thumb_label = ctk.CTkLabel(f, text="", image=thumb, width=160, height=90)
+            thumb_label.grid(row=0, column=0, rowspan=2, sticky="w")
+            self._image_labels.append(thumb_label)
             ctk.CTkLabel(f, text=rv.title, font=("Segoe UI", 12, "bold"), wraplength=160, justify="left").grid(row=0, column=1, sticky="w", padx=8)
-            ctk.CTkLabel(f, text=f"{rv.channel}\n{fmt_views(rv.views)} • {fmt_age(rv.age_days)}", justify="left").grid(row=1, column=1, sticky="nw", padx=8)
+            ctk.CTkLabel(f, text=f"{rv.channel}\n{rv.stats}", justify="left").grid(row=1, column=1, sticky="nw", padx=8)
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -339,6 +545,13 @@ class PlayerOverlay(ctk.CTkToplevel):
         # Close button
         ctk.CTkButton(self, text="✕ Close", command=self.destroy).grid(row=1, column=0, columnspan=2, pady=(0,10))
 
+    def destroy(self):
+        # The CTkImages are shared via CTKIMAGE_CACHE and CTkLabel.destroy() doesn't
+        # unregister its image callback; detach so closed overlays can be collected
+        for label in self._image_labels:
+            label.configure(image=None)
+        super().destroy()
+
 
 class HomeView(ctk.CTkFrame):
     def __init__(self, master, on_open: Callable[[Video], None]):
@@ -378,6 +591,8 @@ class App(ctk.CTk):
         self.content = ctk.CTkFrame(self, fg_color="transparent")
         self.content.grid(row=1, column=1, sticky="nsew")
 
+        # PIL work only; the CTkImages are still created on this thread by the cards
+        prefetch_thumbs(MOCK_VIDEOS)
         self.home = HomeView(self.content, on_open=self._open_video)
         self.home.pack(fill="both", expand=True)
 
@@ -386,6 +601,8 @@ class App(ctk.CTk):
         self.grid_columnconfigure(1, weight=1)
 
         # Responsive: collapse sidebar under 1100px width
+        self._last_width = None
+        self._resize_job = None
         self.bind("<Configure>", self._on_resize)
 
     # ----------------------
@@ -405,7 +622,8 @@ class App(ctk.CTk):
         elif key == "history":
             self.home.grid_v.populate(MOCK_VIDEOS[6:18])
         elif key == "liked":
-            self.home.grid_v.populate(sorted(MOCK_VIDEOS, key=lambda v: v.views, reverse=True)[:12])
+            # top-k selection; no need to sort the whole catalog for 12 items
+            self.home.grid_v.populate(heapq.nlargest(12, MOCK_VIDEOS, key=attrgetter("views")))
 
     def _on_search(self, query: str):
         self.home.search(query)
@@ -414,10 +632,22 @@ class App(ctk.CTk):
         PlayerOverlay(self, video)
 
     def _on_resize(self, event):
-        width = self.winfo_width()
-        self.sidebar.set_collapsed(width < 1100)
+        # <Configure> bubbles up from every child widget; only the window itself matters
+        if event.widget is not self or event.width == self._last_width:
+            return
+        self._last_width = event.width
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(50, self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_job = None
+        self.sidebar.set_collapsed(self._last_width < 1100)
 
 
 if __name__ == "__main__":
+    # Only the app itself reads and writes the on-disk thumbnail cache, not importers
+    _load_asset_cache()
+    atexit.register(_save_asset_cache)
     app = App()
     app.mainloop()